@@ -1,3 +1,4 @@
 from momento_redis.momento_redis_client import MomentoRedis, MomentoRedisBase
+from momento_redis.momento_redis_pipeline import MomentoPipeline
 
-__all__ = ["MomentoRedis", "MomentoRedisBase"]
+__all__ = ["MomentoPipeline", "MomentoRedis", "MomentoRedisBase"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 import datetime
 import time
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar, Union
+from typing import Generic, List, Optional, TypeVar, Union
 
 from momento import CacheClient
 from momento.errors import UnknownException
@@ -18,8 +18,9 @@ from momento.responses import (
 )
 from redis.client import AbstractRedis
 from redis.commands import CoreCommands, RedisModuleCommands, SentinelCommands
-from redis.typing import AbsExpiryT, EncodableT, ExpiryT, KeyT
+from redis.typing import AbsExpiryT, EncodableT, ExpiryT, KeysT, KeyT
 
+from .momento_redis_pipeline import MomentoPipeline
 from .utils.error_utils import convert_momento_to_redis_errors
 
 NOT_IMPL_ERR = (
@@ -60,6 +61,9 @@ class MomentoRedisBase(ABC):
     def delete(self, *names: KeyT) -> int:
         pass
 
+    def mget(self, keys: KeysT, *args: KeyT) -> List[Optional[bytes]]:
+        pass
+
     def decrby(self, name: KeyT, amount: int = 1) -> int:
         pass
 
@@ -72,6 +76,9 @@ class MomentoRedisBase(ABC):
     def incr(self, name: KeyT, amount: int = 1) -> int:
         pass
 
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> MomentoPipeline:
+        pass
+
 
 class MomentoRedis(
     AbstractRedis,
@@ -90,11 +97,11 @@ class MomentoRedis(
 
     def get(self, name: KeyT) -> Optional[bytes]:
         rsp = self._client.get(self._cache_name, name)
-        if isinstance(rsp, CacheGet.Hit):
+        if type(rsp) is CacheGet.Hit:
             return rsp.value_bytes
-        elif isinstance(rsp, CacheGet.Miss):
+        elif type(rsp) is CacheGet.Miss:
             return None
-        elif isinstance(rsp, CacheGet.Error):
+        elif type(rsp) is CacheGet.Error:
             raise convert_momento_to_redis_errors(rsp)
         else:
             raise UnknownException(f"Unknown response type: {rsp}")
@@ -135,38 +142,37 @@ class MomentoRedis(
                 raise UnknownException(f"Unknown type for ex: {type(ex)}")
         elif px is not None:
             if isinstance(px, int):
-                ttl = datetime.timedelta(seconds=int(px / 1000))
+                ttl = datetime.timedelta(milliseconds=px)
             elif isinstance(px, datetime.timedelta):
                 ttl = px
         elif exat is not None:
-            # TODO: is this anywhere close to correct?
+            # Integer exat/pxat are unix timestamps in seconds/milliseconds; compare them against the
+            # current time in whole milliseconds.
             if isinstance(exat, int):
-                ttl = datetime.timedelta(seconds=exat - time.time())
+                ttl = datetime.timedelta(milliseconds=exat * 1000 - time.time_ns() // 1_000_000)
             elif isinstance(exat, datetime.datetime):
                 ttl = exat - datetime.datetime.now()
         elif pxat is not None:
-            # TODO: is this anywhere close to correct? I don't see how this could be implemented
-            #  differently from exat at all?
             if isinstance(pxat, int):
-                ttl = datetime.timedelta(seconds=pxat - time.time())
+                ttl = datetime.timedelta(milliseconds=pxat - time.time_ns() // 1_000_000)
             else:
                 ttl = pxat - datetime.datetime.now()
 
         if nx:
-            nx_rsp = self._client.set_if_not_exists(self._cache_name, key=name, value=value, ttl=ttl)
-            if isinstance(nx_rsp, CacheSetIfNotExists.Error):
+            nx_rsp = self._client.set_if_not_exists(self._cache_name, name, value, ttl)
+            if type(nx_rsp) is CacheSetIfNotExists.Error:
                 raise convert_momento_to_redis_errors(nx_rsp)
-            elif isinstance(nx_rsp, CacheSetIfNotExists.NotStored):
+            elif type(nx_rsp) is CacheSetIfNotExists.NotStored:
                 return False
-            elif isinstance(nx_rsp, CacheSetIfNotExists.Stored):
+            elif type(nx_rsp) is CacheSetIfNotExists.Stored:
                 return True
             else:
                 raise UnknownException(f"Unknown response type: {nx_rsp}")
         else:
             rsp = self._client.set(self._cache_name, name, value, ttl)
-            if isinstance(rsp, CacheSet.Error):
+            if type(rsp) is CacheSet.Error:
                 raise convert_momento_to_redis_errors(rsp)
-            elif isinstance(rsp, CacheSet.Success):
+            elif type(rsp) is CacheSet.Success:
                 return True
             else:
                 raise UnknownException(f"Unknown response type: {rsp}")
@@ -174,12 +180,12 @@ class MomentoRedis(
     def setnx(self, name: KeyT, value: EncodableT) -> bool:
         if not isinstance(value, (str, bytes)):
             value = str(value)
-        rsp = self._client.set_if_not_exists(self._cache_name, key=name, value=value)
-        if isinstance(rsp, CacheSetIfNotExists.Stored):
+        rsp = self._client.set_if_not_exists(self._cache_name, name, value)
+        if type(rsp) is CacheSetIfNotExists.Stored:
             return True
-        elif isinstance(rsp, CacheSetIfNotExists.NotStored):
+        elif type(rsp) is CacheSetIfNotExists.NotStored:
             return False
-        elif isinstance(rsp, CacheSetIfNotExists.Error):
+        elif type(rsp) is CacheSetIfNotExists.Error:
             raise convert_momento_to_redis_errors(rsp)
         else:
             raise UnknownException(f"Unknown response type: {rsp}")
@@ -189,41 +195,54 @@ class MomentoRedis(
             time = datetime.timedelta(seconds=time)
         if not isinstance(value, (str, bytes)):
             value = str(value)
-        rsp = self._client.set(self._cache_name, name, value, ttl=time)  # type: ignore
-        if isinstance(rsp, CacheSet.Error):
+        rsp = self._client.set(self._cache_name, name, value, time)  # type: ignore
+        if type(rsp) is CacheSet.Error:
             raise convert_momento_to_redis_errors(rsp)
         return True
 
     def delete(self, *names: KeyT) -> int:
+        client = self._client
+        cache_name = self._cache_name
         num_deleted = 0
         for name in names:
-            rsp = self._client.delete(self._cache_name, name)
-            if isinstance(rsp, CacheDelete.Success):
+            rsp = client.delete(cache_name, name)
+            if type(rsp) is CacheDelete.Success:
                 num_deleted += 1
         return num_deleted
 
-    def decrby(self, name: KeyT, amount: int = 1) -> int:
-        rsp = self._client.increment(self._cache_name, name, -amount)
-        if isinstance(rsp, CacheIncrement.Success):
+    def mget(self, keys: KeysT, *args: KeyT) -> List[Optional[bytes]]:
+        # Flatten the same way redis-py does: `keys` is either a single key or an iterable of keys,
+        # and any extra positional keys are appended after it.
+        if isinstance(keys, (str, bytes)):
+            names: List[KeyT] = [keys, *args]
+        else:
+            names = [*keys, *args]
+        get = self.get
+        return [get(name) for name in names]
+
+    def _increment(self, name: KeyT, amount: int) -> int:
+        rsp = self._client.increment(self._cache_name, name, amount)
+        if type(rsp) is CacheIncrement.Success:
             return rsp.value
-        elif isinstance(rsp, CacheIncrement.Error):
+        elif type(rsp) is CacheIncrement.Error:
             raise convert_momento_to_redis_errors(rsp)
         else:
             raise UnknownException(f"Unknown response type: {rsp}")
 
+    def decrby(self, name: KeyT, amount: int = 1) -> int:
+        return self._increment(name, -amount)
+
     decr = decrby
 
     def incrby(self, name: KeyT, amount: int = 1) -> int:
-        rsp = self._client.increment(self._cache_name, name, amount)
-        if isinstance(rsp, CacheIncrement.Success):
-            return rsp.value
-        elif isinstance(rsp, CacheIncrement.Error):
-            raise convert_momento_to_redis_errors(rsp)
-        else:
-            raise UnknownException(f"Unknown response type: {rsp}")
+        return self._increment(name, amount)
 
     incr = incrby
 
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> MomentoPipeline:
+        # Momento has no MULTI/EXEC, so `transaction` is accepted for compatibility but not honored.
+        return MomentoPipeline(self)
+
     # Unimplemented methods
     def _not_implemented(self, name: str) -> None:
         raise NotImplementedError(f"{name}{NOT_IMPL_ERR}")
@@ -699,9 +718,6 @@ class MomentoRedis(
     def memory_usage(self, *args, **kwargs) -> None:  # type: ignore
         self._not_implemented("memory_usage")
 
-    def mget(self, *args, **kwargs) -> None:  # type: ignore
-        self._not_implemented("mget")
-
     def migrate(self, *args, **kwargs) -> None:  # type: ignore
         self._not_implemented("migrate")
 
@@ -0,0 +1,104 @@
+"""Momento Python Redis Client pipeline."""
+from __future__ import annotations
+
+import functools
+from types import TracebackType
+from typing import TYPE_CHECKING, Callable, List, Optional, Type, Union
+
+from redis.exceptions import RedisError
+from redis.typing import AbsExpiryT, EncodableT, ExpiryT, KeysT, KeyT
+
+if TYPE_CHECKING:
+    from .momento_redis_client import MomentoRedisBase
+
+
+class MomentoPipeline:
+    """Buffers commands and runs them against a MomentoRedis client when executed.
+
+    Momento has no MULTI/EXEC, so queued commands are not applied atomically; they are sent in
+    the order they were queued when `execute` is called, and their results are returned in the
+    same order.
+    """
+
+    def __init__(self, client: MomentoRedisBase):
+        self._client = client
+        self._command_stack: List[Callable[[], object]] = []
+
+    def __enter__(self) -> MomentoPipeline:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.reset()
+
+    def __len__(self) -> int:
+        return len(self._command_stack)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def reset(self) -> None:
+        self._command_stack = []
+
+    def execute(self, raise_on_error: bool = True) -> List[object]:
+        stack = self._command_stack
+        self._command_stack = []
+        results: List[object] = []
+        for command in stack:
+            try:
+                results.append(command())
+            except RedisError as e:
+                results.append(e)
+        if raise_on_error:
+            for result in results:
+                if isinstance(result, RedisError):
+                    raise result
+        return results
+
+    def _queue(self, command: Callable[[], object]) -> MomentoPipeline:
+        self._command_stack.append(command)
+        return self
+
+    def get(self, name: KeyT) -> MomentoPipeline:
+        return self._queue(functools.partial(self._client.get, name))
+
+    def set(
+        self,
+        name: KeyT,
+        value: EncodableT,
+        ex: Union[ExpiryT, None] = None,
+        px: Union[ExpiryT, None] = None,
+        nx: bool = False,
+        xx: bool = False,
+        keepttl: bool = False,
+        get: bool = False,
+        exat: Union[AbsExpiryT, None] = None,
+        pxat: Union[AbsExpiryT, None] = None,
+    ) -> MomentoPipeline:
+        return self._queue(functools.partial(self._client.set, name, value, ex, px, nx, xx, keepttl, get, exat, pxat))
+
+    def setnx(self, name: KeyT, value: EncodableT) -> MomentoPipeline:
+        return self._queue(functools.partial(self._client.setnx, name, value))
+
+    def setex(self, name: KeyT, time: ExpiryT, value: EncodableT) -> MomentoPipeline:
+        return self._queue(functools.partial(self._client.setex, name, time, value))
+
+    def delete(self, *names: KeyT) -> MomentoPipeline:
+        return self._queue(functools.partial(self._client.delete, *names))
+
+    def mget(self, keys: KeysT, *args: KeyT) -> MomentoPipeline:
+        return self._queue(functools.partial(self._client.mget, keys, *args))
+
+    def decrby(self, name: KeyT, amount: int = 1) -> MomentoPipeline:
+        return self._queue(functools.partial(self._client.decrby, name, amount))
+
+    decr = decrby
+
+    def incrby(self, name: KeyT, amount: int = 1) -> MomentoPipeline:
+        return self._queue(functools.partial(self._client.incrby, name, amount))
+
+    incr = incrby
@@ -3,35 +3,92 @@ from __future__ import annotations
 import os
 import uuid
 from datetime import timedelta
+from typing import List
 
 import momento
 import pytest
-from redis import Redis
+from _pytest.fixtures import FixtureRequest
+from redis import Connection, ConnectionPool, Redis
 
 from momento_redis import MomentoRedis
 
 
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    # Run the tests that wait for keys to expire last so that fast failures surface first. The sort is
+    # stable, so the remaining order is unchanged.
+    items.sort(key=lambda item: item.get_closest_marker("ttl") is not None)
+
+
 @pytest.fixture(scope="session")
 def momento_redis_client():  # type: ignore
-    cache_name = f"momento-python-redis-client-test-{uuid.uuid4()}"
+    if os.getenv("TEST_SKIP_MOMENTO", False):
+        pytest.skip("momento disabled")
+    # pytest-xdist sets PYTEST_XDIST_WORKER in each worker process; each worker gets its own cache.
+    worker_id = os.getenv("PYTEST_XDIST_WORKER", "master")
+    cache_name = f"momento-python-redis-client-test-{worker_id}-{uuid.uuid4()}"
     with momento.CacheClient.create(
         momento.Configurations.Laptop.latest(),
         momento.CredentialProvider.from_environment_variable("TEST_AUTH_TOKEN"),
         timedelta(seconds=60),
     ) as client:
         client.create_cache(cache_name)
+        # Warm up the data-plane channel so the first test doesn't pay for connection setup.
+        client.get(cache_name, "__warmup__")
         try:
             yield MomentoRedis(client, cache_name)
         finally:
             client.delete_cache(cache_name)
 
 
+@pytest.fixture
+def client_instance(request: FixtureRequest) -> object:
+    # Resolves an indirectly parametrized client name to the session-scoped client fixture of that name.
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture(scope="session")
+def key_prefix() -> str:
+    return uuid.uuid4().hex
+
+
+@pytest.fixture
+def key(key_prefix: str, request: FixtureRequest) -> str:
+    # Unique per session and per test, and traceable back to the test that wrote it.
+    return f"{key_prefix}-{request.node.nodeid}"
+
+
 @pytest.fixture(scope="session")
 def redis_client():  # type: ignore
+    if os.getenv("TEST_SKIP_REDIS", False):
+        pytest.skip("redis disabled")
     host = os.getenv("TEST_REDIS_HOST", "localhost")
     port = os.getenv("TEST_REDIS_PORT", 6379)
-    with Redis(host, int(port), 0) as client:
-        try:
-            yield client
-        finally:
-            client.close()
+    # An explicit pool lets pipelined and concurrent commands share connections instead of a single implicit one.
+    pool = ConnectionPool(host=host, port=int(port), db=0, max_connections=8)
+    try:
+        client = Redis(connection_pool=pool)
+        client.ping()
+        yield client
+    finally:
+        pool.disconnect()
+
+
+class _OfflineConnection(Connection):
+    def connect(self) -> None:
+        raise AssertionError("redis_client_offline tried to reach a Redis server")
+
+
+class _OfflineConnectionPool(ConnectionPool):
+    # Hands out connections without connecting them; any command that actually needs the server fails loudly.
+    def __init__(self) -> None:
+        super().__init__(connection_class=_OfflineConnection)
+
+    def get_connection(self, command_name: object, *keys: object, **options: object) -> Connection:
+        return self.make_connection()
+
+
+@pytest.fixture(scope="session")
+def redis_client_offline():  # type: ignore
+    # For tests whose commands fail client-side (e.g. argument encoding) before anything is sent, so they can
+    # run without a Redis server.
+    return Redis(connection_pool=_OfflineConnectionPool())
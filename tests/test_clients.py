@@ -1,12 +1,11 @@
 import datetime
 import os
 import time
-import uuid
-from typing import Optional, Union
+from typing import Iterable, Optional, Tuple, Union
 
 import pytest
 import redis
-from _pytest.fixtures import FixtureRequest
+from redis.typing import AbsExpiryT, EncodableT, ExpiryT, KeyT
 
 from momento_redis import MomentoRedis
 
@@ -15,284 +14,266 @@ TClient = Union[MomentoRedis, redis.Redis]
 skip_redis = os.getenv("TEST_SKIP_REDIS", False)
 skip_momento = os.getenv("TEST_SKIP_MOMENTO", False)
 
+REDIS_MARKS = [pytest.mark.xdist_group("redis"), pytest.mark.skipif(bool(skip_redis), reason="redis disabled")]
+MOMENTO_MARKS = [pytest.mark.xdist_group("momento"), pytest.mark.skipif(bool(skip_momento), reason="momento disabled")]
 
-def _use_client(client: str) -> bool:
-    if client == "momento_redis_client" and skip_momento:
-        return False
-    elif client == "redis_client" and skip_redis:
-        return False
-    return True
-
-
-@pytest.mark.parametrize(
-    "client,exception",
+CLIENTS = pytest.mark.parametrize(
+    "client_instance",
+    [
+        pytest.param("redis_client", marks=REDIS_MARKS),
+        pytest.param("momento_redis_client", marks=MOMENTO_MARKS),
+    ],
+    indirect=True,
+)
+CLIENTS_WITH_EXC = pytest.mark.parametrize(
+    "client_instance,exception",
     [
-        ("redis_client", redis.exceptions.DataError),
-        ("momento_redis_client", redis.exceptions.RedisError),
+        # redis-py rejects the key while encoding the command, so this case needs no server.
+        pytest.param("redis_client_offline", redis.exceptions.DataError, marks=pytest.mark.xdist_group("redis")),
+        pytest.param("momento_redis_client", redis.exceptions.RedisError, marks=MOMENTO_MARKS),
     ],
     ids=["redis", "momento"],
+    indirect=["client_instance"],
 )
-def test_get_sad_path(client: str, exception: Exception, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping {client}")
-    test_client: TClient = request.getfixturevalue(client)
+
+
+def _set_and_get(
+    client: TClient,
+    key: KeyT,
+    value: EncodableT,
+    ex: Optional[ExpiryT] = None,
+    px: Optional[ExpiryT] = None,
+    exat: Optional[AbsExpiryT] = None,
+    pxat: Optional[AbsExpiryT] = None,
+) -> object:
+    # Send the set and the read-back together rather than paying two round trips.
+    with client.pipeline(transaction=False) as pipe:
+        pipe.set(key, value, ex=ex, px=px, exat=exat, pxat=pxat)
+        pipe.get(key)
+        _, val = pipe.execute()
+    return val
+
+
+def _seed(client: TClient, items: Iterable[Tuple[KeyT, EncodableT]]) -> None:
+    # Write all of a test's fixture data in one pipeline instead of one round trip per key.
+    with client.pipeline(transaction=False) as pipe:
+        for name, value in items:
+            pipe.set(name, value)
+        pipe.execute()
+
+
+def _wait_for_expiry(client: TClient, key: KeyT, timeout: float = 3.5) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if client.get(key) is None:
+            return
+        time.sleep(0.05)
+    raise AssertionError(f"{key!r} did not expire within {timeout} seconds")
+
+
+@CLIENTS_WITH_EXC
+def test_get_sad_path(client_instance: TClient, exception: Exception) -> None:
     with pytest.raises(Exception) as exc_info:
-        test_client.get(None)  # type: ignore
+        client_instance.get(None)  # type: ignore
     assert exc_info.type == exception  # type: ignore
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_set_get_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, "bar")
-    val = test_client.get(key)
+@CLIENTS
+def test_set_get_happy_path(client_instance: TClient, key: str) -> None:
+    val = _set_and_get(client_instance, key, "bar")
     assert val == b"bar"
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_get_miss_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    val = test_client.get(key)
+@CLIENTS
+def test_get_miss_happy_path(client_instance: TClient, key: str) -> None:
+    val = client_instance.get(key)
     assert val is None
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_set_bytes_key_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4()).encode("utf8")
-    test_client.set(key, "bar")
-    val = test_client.get(key)
+@CLIENTS
+def test_set_bytes_key_happy_path(client_instance: TClient, key: str) -> None:
+    bytes_key = key.encode("utf8")
+    val = _set_and_get(client_instance, bytes_key, "bar")
     assert val == b"bar"
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_set_with_int_ex_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, "bar", ex=2)
-    val = test_client.get(key)
+@CLIENTS
+@pytest.mark.ttl
+def test_set_with_int_ex_happy_path(client_instance: TClient, key: str) -> None:
+    val = _set_and_get(client_instance, key, "bar", ex=1)
     assert val == b"bar"
-    time.sleep(3)
-    val = test_client.get(key)
-    assert val is None
+    _wait_for_expiry(client_instance, key)
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_set_with_timespan_ex_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, "bar", ex=datetime.timedelta(seconds=2))
-    val = test_client.get(key)
+@CLIENTS
+@pytest.mark.ttl
+def test_set_with_timespan_ex_happy_path(client_instance: TClient, key: str) -> None:
+    val = _set_and_get(client_instance, key, "bar", ex=datetime.timedelta(seconds=1))
     assert val == b"bar"
-    time.sleep(3)
-    val = test_client.get(key)
-    assert val is None
+    _wait_for_expiry(client_instance, key)
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_set_with_int_px_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, "bar", px=2500)
-    val = test_client.get(key)
+@CLIENTS
+@pytest.mark.ttl
+def test_set_with_int_px_happy_path(client_instance: TClient, key: str) -> None:
+    val = _set_and_get(client_instance, key, "bar", px=500)
     assert val == b"bar"
-    time.sleep(3)
-    val = test_client.get(key)
-    assert val is None
+    _wait_for_expiry(client_instance, key)
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_set_with_timespan_px_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, "bar", px=datetime.timedelta(milliseconds=2500))
-    val = test_client.get(key)
+@CLIENTS
+@pytest.mark.ttl
+def test_set_with_timespan_px_happy_path(client_instance: TClient, key: str) -> None:
+    val = _set_and_get(client_instance, key, "bar", px=datetime.timedelta(milliseconds=500))
     assert val == b"bar"
-    time.sleep(3)
-    val = test_client.get(key)
-    assert val is None
+    _wait_for_expiry(client_instance, key)
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_set_with_int_exat_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
+@CLIENTS
+@pytest.mark.ttl
+def test_set_with_int_exat_happy_path(client_instance: TClient, key: str) -> None:
     secs_now = int(time.time())
     exat = secs_now + 2
-    test_client.set(key, "bar", exat=exat)
-    val = test_client.get(key)
+    val = _set_and_get(client_instance, key, "bar", exat=exat)
     assert val == b"bar"
-    time.sleep(3)
-    val = test_client.get(key)
-    assert val is None
+    _wait_for_expiry(client_instance, key)
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_set_with_datetime_exat_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    datetime_now = datetime.datetime.now()
-    exat = datetime_now + datetime.timedelta(seconds=2)
-    test_client.set(key, "bar", exat=exat)
-    val = test_client.get(key)
+@CLIENTS
+@pytest.mark.ttl
+def test_set_with_datetime_exat_happy_path(client_instance: TClient, key: str) -> None:
+    exat = datetime.datetime.fromtimestamp(time.time() + 2)
+    val = _set_and_get(client_instance, key, "bar", exat=exat)
     assert val == b"bar"
-    time.sleep(3)
-    val = test_client.get(key)
-    assert val is None
+    _wait_for_expiry(client_instance, key)
+
+
+@CLIENTS
+@pytest.mark.ttl
+def test_set_with_int_pxat_happy_path(client_instance: TClient, key: str) -> None:
+    millis_now = time.time_ns() // 1_000_000
+    pxat = millis_now + 500
+    val = _set_and_get(client_instance, key, "bar", pxat=pxat)
+    assert val == b"bar"
+    _wait_for_expiry(client_instance, key)
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_setnx_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    resp = test_client.setnx(key, "bar")
+@CLIENTS
+def test_setnx_happy_path(client_instance: TClient, key: str) -> None:
+    resp = client_instance.setnx(key, "bar")
     assert resp is True
-    resp = test_client.setnx(key, "bar")
+    resp = client_instance.setnx(key, "bar")
     assert resp is False
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_setnx_bytes_key_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4()).encode("utf8")
-    test_client.setnx(key, "bar")
-    val = test_client.get(key)
+@CLIENTS
+def test_setnx_bytes_key_happy_path(client_instance: TClient, key: str) -> None:
+    bytes_key = key.encode("utf8")
+    client_instance.setnx(bytes_key, "bar")
+    val = client_instance.get(bytes_key)
     assert val == b"bar"
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_setex_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.setex(key, datetime.timedelta(seconds=2), "bar")
-    val = test_client.get(key)
+@CLIENTS
+@pytest.mark.ttl
+def test_setex_happy_path(client_instance: TClient, key: str) -> None:
+    client_instance.setex(key, datetime.timedelta(seconds=1), "bar")
+    val = client_instance.get(key)
     assert val == b"bar"
-    time.sleep(3)
-    val = test_client.get(key)
-    assert val is None
+    _wait_for_expiry(client_instance, key)
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_delete_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, "bar")
-    val = test_client.get(key)
+@CLIENTS
+def test_delete_happy_path(client_instance: TClient, key: str) -> None:
+    val = _set_and_get(client_instance, key, "bar")
     assert val == b"bar"
-    test_client.delete(key)
-    val = test_client.get(key)
+    client_instance.delete(key)
+    val = client_instance.get(key)
     assert val is None
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
-def test_delete_multi_happy_path(client: str, request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    keys = [str(uuid.uuid4()) for _ in range(0, 5)]
-    keys.append(f"{uuid.uuid4()}-notakey")
-    for key in keys:
-        test_client.set(key, "bar")
-        val = test_client.get(key)
-        assert val == b"bar"
-    val = test_client.delete(*keys)
-    assert val == len(keys)
-    for key in keys:
-        val = test_client.get(key)
-        assert val is None
-
-
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
+@CLIENTS
+def test_delete_multi_happy_path(client_instance: TClient, key: str) -> None:
+    keys = [f"{key}-{i}" for i in range(0, 5)]
+    keys.append(f"{key}-notakey")
+    _seed(client_instance, ((name, "bar") for name in keys))
+    val = client_instance.mget(keys)
+    assert val == [b"bar"] * len(keys)
+    num_deleted = client_instance.delete(*keys)
+    assert num_deleted == len(keys)
+    val = client_instance.mget(keys)
+    assert val == [None] * len(keys)
+
+
+@CLIENTS
+def test_mget_happy_path(client_instance: TClient, key: str) -> None:
+    _seed(client_instance, [(f"{key}-1", "bar1"), (f"{key}-2", "bar2"), (f"{key}-3", "bar3")])
+    expected = [b"bar1", b"bar2", None, b"bar3"]
+    val = client_instance.mget([f"{key}-1", f"{key}-2", f"{key}-notakey", f"{key}-3"])
+    assert val == expected
+    val = client_instance.mget(f"{key}-1", f"{key}-2", f"{key}-notakey", f"{key}-3")
+    assert val == expected
+    val = client_instance.mget([f"{key}-1", f"{key}-2"], f"{key}-notakey", f"{key}-3")
+    assert val == expected
+
+
+@CLIENTS
 @pytest.mark.parametrize("initial_amount", ["101", 101], ids=["string", "integer"])
 @pytest.mark.parametrize("decr_amount", [1, None], ids=["value", "no_value"])
-def test_decr_happy_path(client: str, initial_amount: int, decr_amount: Optional[int], request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, initial_amount)
+def test_decr_happy_path(client_instance: TClient, initial_amount: int, decr_amount: Optional[int], key: str) -> None:
+    client_instance.set(key, initial_amount)
     if decr_amount is None:
-        val = test_client.decr(key)
+        val = client_instance.decr(key)
     else:
-        val = test_client.decr(key, decr_amount)
+        val = client_instance.decr(key, decr_amount)
     assert val == 100
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
+@CLIENTS
 @pytest.mark.parametrize("initial_amount", ["105", 105], ids=["string", "integer"])
 @pytest.mark.parametrize("decr_amount,expected", [(5, 100), (None, 104)], ids=["value", "no_value"])
 def test_decrby_happy_path(
-    client: str, initial_amount: int, decr_amount: Optional[int], expected: int, request: FixtureRequest
+    client_instance: TClient, initial_amount: int, decr_amount: Optional[int], expected: int, key: str
 ) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, initial_amount)
+    client_instance.set(key, initial_amount)
     if decr_amount is None:
-        val = test_client.decrby(key)
+        val = client_instance.decrby(key)
     else:
-        val = test_client.decrby(key, decr_amount)
+        val = client_instance.decrby(key, decr_amount)
     assert val == expected
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
+@CLIENTS
 @pytest.mark.parametrize("initial_amount", ["99", 99], ids=["string", "integer"])
 @pytest.mark.parametrize("incr_amount", [1, None], ids=["value", "no_value"])
-def test_incr_happy_path(client: str, initial_amount: int, incr_amount: Optional[int], request: FixtureRequest) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, initial_amount)
+def test_incr_happy_path(client_instance: TClient, initial_amount: int, incr_amount: Optional[int], key: str) -> None:
+    client_instance.set(key, initial_amount)
     if incr_amount is None:
-        val = test_client.incr(key)
+        val = client_instance.incr(key)
     else:
-        val = test_client.incr(key, incr_amount)
+        val = client_instance.incr(key, incr_amount)
     assert val == 100
 
 
-@pytest.mark.parametrize("client", ["redis_client", "momento_redis_client"])
+@CLIENTS
 @pytest.mark.parametrize("initial_amount", ["95", 95], ids=["string", "integer"])
 @pytest.mark.parametrize("incr_amount,expected", [(5, 100), (None, 96)], ids=["value", "no_value"])
 def test_incrby_happy_path(
-    client: str, initial_amount: int, incr_amount: Optional[int], expected: int, request: FixtureRequest
+    client_instance: TClient, initial_amount: int, incr_amount: Optional[int], expected: int, key: str
 ) -> None:
-    if not _use_client(client):
-        pytest.skip(f"skipping client: {client}")
-    test_client: TClient = request.getfixturevalue(client)
-    key = str(uuid.uuid4())
-    test_client.set(key, initial_amount)
+    client_instance.set(key, initial_amount)
     if incr_amount is None:
-        val = test_client.incrby(key)
+        val = client_instance.incrby(key)
     else:
-        val = test_client.incrby(key, incr_amount)
+        val = client_instance.incrby(key, incr_amount)
     assert val == expected
+
+
+@CLIENTS
+def test_pipeline_happy_path(client_instance: TClient, key: str) -> None:
+    counter = f"{key}-counter"
+    with client_instance.pipeline() as pipe:
+        pipe.set(key, "bar").get(key).incr(counter).incrby(counter, 5).delete(key).get(key)
+        assert len(pipe) == 6
+        results = pipe.execute()
+    assert results == [True, b"bar", 1, 6, 1, None]